@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import hashlib
 from utils.styles import load_custom_css
 from utils.data_processor import DataProcessor
 
@@ -78,20 +79,21 @@ if st.button("🚀 Start Data Processing", type="primary", use_container_width=T
         
         if min_transaction_size > 1:
             # Filter transactions by size
-            transaction_sizes = processed_data['clean_df'].groupby('TransactionID').size()
-            valid_transactions = transaction_sizes[transaction_sizes >= min_transaction_size].index
-            processed_data['clean_df'] = processed_data['clean_df'][
-                processed_data['clean_df']['TransactionID'].isin(valid_transactions)
-            ]
+            clean_df = processed_data['clean_df']
+            transaction_sizes = clean_df.groupby('TransactionID', observed=True)['Product'].transform('size')
+            filtered_df = clean_df[transaction_sizes >= min_transaction_size]
             
-            # Recreate transactions and basket encoding
-            processed_data['transactions'] = processed_data['clean_df'].groupby('TransactionID')['Product'].apply(list).tolist()
+            # Drop the categories of filtered-out transactions and products
+            processed_data['clean_df'] = filtered_df.assign(
+                TransactionID=filtered_df['TransactionID'].cat.remove_unused_categories(),
+                Product=filtered_df['Product'].cat.remove_unused_categories()
+            )
             
-            # Re-encode
-            from mlxtend.preprocessing import TransactionEncoder
-            te = TransactionEncoder()
-            te_array = te.fit(processed_data['transactions']).transform(processed_data['transactions'])
-            processed_data['basket_df'] = pd.DataFrame(te_array, columns=te.columns_)
+            # Recreate transactions
+            processed_data['transactions'] = processor.build_transactions(processed_data['clean_df'])
+            processed_data['n_transactions'] = len(processed_data['transactions'])
+            processed_data['n_products'] = len(processed_data['clean_df']['Product'].cat.categories)
+            processed_data['total_items'] = len(processed_data['clean_df'])
         
         # Step 4: Final validation
         status_text.text("Step 4/5: Final validation...")
@@ -101,6 +103,15 @@ if st.button("🚀 Start Data Processing", type="primary", use_container_width=T
             st.error("❌ No valid transactions remain after processing. Try relaxing the filters.")
             st.stop()
         
+        # One-hot encode the final, filtered data once
+        processed_data['basket_df'] = processor.encode_basket(processed_data['clean_df'])
+        processed_data['preprocessing_steps'].append("✅ Applied one-hot encoding for analysis")
+        
+        # Content fingerprint of the final data, hashed once here so exports can be
+        # cached across sessions without rehashing clean_df on every rerun
+        hashed_rows = pd.util.hash_pandas_object(processed_data['clean_df'], index=False)
+        processed_data['fingerprint'] = hashlib.sha1(hashed_rows.to_numpy().tobytes()).hexdigest()
+        
         # Step 5: Store results
         status_text.text("Step 5/5: Finalizing...")
         progress_bar.progress(100)
@@ -263,7 +274,7 @@ if 'processed_data' in st.session_state:
     # Transaction matrix preview
     st.subheader("🔢 Transaction Matrix Preview")
     st.write("Binary matrix showing product presence in transactions:")
-    st.dataframe(processed['basket_df'].head(5), use_container_width=True)
+    st.dataframe(processed['basket_df'].head(5).sparse.to_dense(), use_container_width=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
     
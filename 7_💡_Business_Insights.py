@@ -90,7 +90,7 @@ if 'clean_df' in processed_data:
         
         # If price data is available
         if 'Price' in clean_df.columns:
-            avg_transaction_value = clean_df.groupby('TransactionID')['Price'].sum().mean()
+            avg_transaction_value = clean_df.groupby('TransactionID', observed=True)['Price'].sum().mean()
             total_revenue = clean_df['Price'].sum()
             
             st.metric("Average Transaction Value", f"₹{avg_transaction_value:.2f}")
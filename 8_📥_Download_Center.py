@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 from utils.styles import load_custom_css
-from utils.export_manager import ExportManager
+from utils.export_manager import ExportManager, export_cache_key, cached_export, session_export
 import io
 import zipfile
 
@@ -32,6 +32,15 @@ export_manager = ExportManager()
 analysis_results = st.session_state.analysis_results
 processed_data = st.session_state.get('processed_data', {})
 
+# Dataset dimensions are stored as plain ints at processing time; fall back to
+# measuring the frames for sessions processed before those keys existed
+n_transactions = processed_data.get('n_transactions')
+if n_transactions is None:
+    n_transactions = len(processed_data.get('transactions', []))
+n_products = processed_data.get('n_products')
+if n_products is None:
+    n_products = len(processed_data.get('basket_df', pd.DataFrame()).columns)
+
 # Update export ready status
 st.session_state.export_ready = True
 
@@ -79,109 +88,136 @@ with col4:
 
 st.markdown('</div>', unsafe_allow_html=True)
 
-# Individual downloads section
-st.markdown('<div class="card-container-enhanced">', unsafe_allow_html=True)
-st.markdown("### 📊 Individual File Downloads")
-
-# CSV Downloads
-st.markdown("#### 📁 CSV Format")
-csv_col1, csv_col2, csv_col3 = st.columns(3)
-
-with csv_col1:
-    if 'frequent_itemsets' in analysis_results and not analysis_results['frequent_itemsets'].empty:
-        itemsets_csv, itemsets_filename = export_manager.create_csv_export(
-            analysis_results['frequent_itemsets'], "frequent_itemsets"
-        )
-        file_size = export_manager.get_file_size_mb(itemsets_csv)
-        
-        export_manager.create_download_button(
-            itemsets_csv,
-            itemsets_filename,
-            f"📊 Download Frequent Itemsets\n({file_size:.2f} MB)",
-            "text/csv",
-            "Download frequent itemsets as CSV file",
-            key="csv_itemsets"
-        )
-
-with csv_col2:
-    if 'rules' in analysis_results and not analysis_results['rules'].empty:
-        # Prepare rules for CSV export
-        rules_export = analysis_results['rules'].copy()
-        rules_export['antecedents'] = rules_export['antecedents'].apply(lambda x: ', '.join(list(x)))
-        rules_export['consequents'] = rules_export['consequents'].apply(lambda x: ', '.join(list(x)))
-        rules_csv_data = rules_export[['antecedents', 'consequents', 'support', 'confidence', 'lift']]
-        
-        rules_csv, rules_filename = export_manager.create_csv_export(
-            rules_csv_data, "association_rules"
-        )
-        file_size = export_manager.get_file_size_mb(rules_csv)
-        
-        export_manager.create_download_button(
-            rules_csv,
-            rules_filename,
-            f"🔗 Download Association Rules\n({file_size:.2f} MB)",
-            "text/csv",
-            "Download association rules as CSV file",
-            key="csv_rules"
-        )
-
-with csv_col3:
-    if 'clean_df' in processed_data:
-        processed_csv, processed_filename = export_manager.create_csv_export(
-            processed_data['clean_df'], "processed_data"
-        )
-        file_size = export_manager.get_file_size_mb(processed_csv)
-        
-        export_manager.create_download_button(
-            processed_csv,
-            processed_filename,
-            f"🔄 Download Processed Data\n({file_size:.2f} MB)",
-            "text/csv",
-            "Download cleaned and processed transaction data",
-            key="csv_processed"
-        )
-
-st.markdown("---")
-
-# Excel Download
-st.markdown("#### 📈 Excel Format")
-excel_col1, excel_col2 = st.columns([2, 1])
-
-with excel_col1:
-    # Prepare Excel data
-    excel_data_dict = {}
+# Download sections run as a fragment, so clicking a download or prepare
+# button reruns only this section instead of the whole page
+@st.fragment
+def downloads_section(analysis_results, processed_data):
+    has_itemsets = bool('frequent_itemsets' in analysis_results and not analysis_results['frequent_itemsets'].empty)
+    has_rules = bool('rules' in analysis_results and not analysis_results['rules'].empty)
     
-    if 'frequent_itemsets' in analysis_results and not analysis_results['frequent_itemsets'].empty:
-        itemsets_export = analysis_results['frequent_itemsets'].copy()
-        itemsets_export['itemsets'] = itemsets_export['itemsets'].apply(lambda x: ', '.join(list(x)))
-        excel_data_dict['Frequent_Itemsets'] = itemsets_export
+    # Nothing to export yet, so skip building any files
+    if not (has_itemsets or has_rules):
+        st.info("ℹ️ Run analysis first to generate downloadable files.")
+        return
     
-    if 'rules' in analysis_results and not analysis_results['rules'].empty:
-        rules_export = analysis_results['rules'].copy()
-        rules_export['antecedents'] = rules_export['antecedents'].apply(lambda x: ', '.join(list(x)))
-        rules_export['consequents'] = rules_export['consequents'].apply(lambda x: ', '.join(list(x)))
-        excel_data_dict['Association_Rules'] = rules_export[['antecedents', 'consequents', 'support', 'confidence', 'lift']]
+    # Timestamp-free files are cached on disk per analysis and shared across sessions;
+    # JSON embeds its export time, so it is kept per session instead
+    export_key = export_cache_key(analysis_results, processed_data)
     
-    if 'clean_df' in processed_data:
-        excel_data_dict['Processed_Data'] = processed_data['clean_df']
+    # Exports that contain the processed data are only shared once the processing
+    # page has fingerprinted its content; older results stay per session
+    processed_export = cached_export if processed_data.get('fingerprint') else session_export
     
-    # Add summary sheet
-    summary_data = {
-        'Metric': ['Total Transactions', 'Unique Products', 'Frequent Itemsets', 'Association Rules', 'Analysis Algorithm'],
-        'Value': [
-            len(processed_data.get('transactions', [])),
-            len(processed_data.get('basket_df', pd.DataFrame()).columns),
-            len(analysis_results.get('frequent_itemsets', pd.DataFrame())),
-            len(analysis_results.get('rules', pd.DataFrame())),
-            analysis_results.get('algorithm', 'Unknown')
-        ]
-    }
-    excel_data_dict['Analysis_Summary'] = pd.DataFrame(summary_data)
+    # Individual downloads section
+    st.markdown('<div class="card-container-enhanced">', unsafe_allow_html=True)
+    st.markdown("### 📊 Individual File Downloads")
+
+    # CSV Downloads
+    st.markdown("#### 📁 CSV Format")
+    csv_col1, csv_col2, csv_col3 = st.columns(3)
+
+    with csv_col1:
+        if has_itemsets:
+            itemsets_csv = cached_export(export_key, "csv_itemsets", lambda: export_manager.create_csv_export(
+                analysis_results['frequent_itemsets'], "frequent_itemsets"
+            )[0])
+            itemsets_filename = export_manager.filename("frequent_itemsets", "csv")
+            file_size = export_manager.get_file_size_mb(itemsets_csv)
+        
+            export_manager.create_download_button(
+                itemsets_csv,
+                itemsets_filename,
+                f"📊 Download Frequent Itemsets\n({file_size:.2f} MB)",
+                "text/csv",
+                "Download frequent itemsets as CSV file",
+                key="csv_itemsets"
+            )
+
+    with csv_col2:
+        if has_rules:
+            def build_rules_csv():
+                # Prepare rules for CSV export
+                rules_export = analysis_results['rules'].copy()
+                rules_export['antecedents'] = [', '.join(x) for x in rules_export['antecedents'].to_numpy()]
+                rules_export['consequents'] = [', '.join(x) for x in rules_export['consequents'].to_numpy()]
+                rules_csv_data = rules_export[['antecedents', 'consequents', 'support', 'confidence', 'lift']]
+                
+                return export_manager.create_csv_export(rules_csv_data, "association_rules")[0]
+        
+            rules_csv = cached_export(export_key, "csv_rules", build_rules_csv)
+            rules_filename = export_manager.filename("association_rules", "csv")
+            file_size = export_manager.get_file_size_mb(rules_csv)
+        
+            export_manager.create_download_button(
+                rules_csv,
+                rules_filename,
+                f"🔗 Download Association Rules\n({file_size:.2f} MB)",
+                "text/csv",
+                "Download association rules as CSV file",
+                key="csv_rules"
+            )
+
+    with csv_col3:
+        if 'clean_df' in processed_data:
+            processed_csv = processed_export(export_key, "csv_processed", lambda: export_manager.create_csv_export(
+                processed_data['clean_df'], "processed_data"
+            )[0])
+            processed_filename = export_manager.filename("processed_data", "csv")
+            file_size = export_manager.get_file_size_mb(processed_csv)
+        
+            export_manager.create_download_button(
+                processed_csv,
+                processed_filename,
+                f"🔄 Download Processed Data\n({file_size:.2f} MB)",
+                "text/csv",
+                "Download cleaned and processed transaction data",
+                key="csv_processed"
+            )
+
+    st.markdown("---")
+
+    # Excel Download
+    st.markdown("#### 📈 Excel Format")
+    excel_col1, excel_col2 = st.columns([2, 1])
+
+    with excel_col1:
+        def build_excel():
+            # Prepare Excel data
+            excel_data_dict = {}
+            
+            if has_itemsets:
+                itemsets_export = analysis_results['frequent_itemsets'].copy()
+                itemsets_export['itemsets'] = [', '.join(x) for x in itemsets_export['itemsets'].to_numpy()]
+                excel_data_dict['Frequent_Itemsets'] = itemsets_export
+            
+            if has_rules:
+                rules_export = analysis_results['rules'].copy()
+                rules_export['antecedents'] = [', '.join(x) for x in rules_export['antecedents'].to_numpy()]
+                rules_export['consequents'] = [', '.join(x) for x in rules_export['consequents'].to_numpy()]
+                excel_data_dict['Association_Rules'] = rules_export[['antecedents', 'consequents', 'support', 'confidence', 'lift']]
+            
+            if 'clean_df' in processed_data:
+                excel_data_dict['Processed_Data'] = processed_data['clean_df']
+            
+            # Add summary sheet
+            summary_data = {
+                'Metric': ['Total Transactions', 'Unique Products', 'Frequent Itemsets', 'Association Rules', 'Analysis Algorithm'],
+                'Value': [
+                    n_transactions,
+                    n_products,
+                    len(analysis_results.get('frequent_itemsets', pd.DataFrame())),
+                    len(analysis_results.get('rules', pd.DataFrame())),
+                    analysis_results.get('algorithm', 'Unknown')
+                ]
+            }
+            excel_data_dict['Analysis_Summary'] = summary_data
+            
+            return export_manager.create_excel_export(excel_data_dict)[0]
     
-    if excel_data_dict:
-        excel_data, excel_filename = export_manager.create_excel_export(excel_data_dict)
+        excel_data = processed_export(export_key, "excel_complete", build_excel)
+        excel_filename = export_manager.filename("analysis", "xlsx")
         file_size = export_manager.get_file_size_mb(excel_data)
-        
+    
         export_manager.create_download_button(
             excel_data,
             excel_filename,
@@ -191,150 +227,179 @@ with excel_col1:
             key="excel_complete"
         )
 
-with excel_col2:
-    st.markdown("""
-    **Excel Workbook Contents:**
-    - 📊 Frequent Itemsets
-    - 🔗 Association Rules  
-    - 🔄 Processed Data
-    - 📋 Analysis Summary
-    - 📈 Ready for pivot tables
-    """)
-
-st.markdown("---")
-
-# JSON Download
-st.markdown("#### 🔗 JSON Format")
-json_col1, json_col2 = st.columns([2, 1])
-
-with json_col1:
-    # Prepare JSON data
-    json_export_data = {
-        'analysis_parameters': analysis_results.get('parameters', {}),
-        'analysis_algorithm': analysis_results.get('algorithm', 'Unknown'),
-        'export_timestamp': export_manager.timestamp
-    }
+    with excel_col2:
+        st.markdown("""
+        **Excel Workbook Contents:**
+        - 📊 Frequent Itemsets
+        - 🔗 Association Rules  
+        - 🔄 Processed Data
+        - 📋 Analysis Summary
+        - 📈 Ready for pivot tables
+        """)
+
+    st.markdown("---")
+
+    # JSON Download
+    st.markdown("#### 🔗 JSON Format")
+    json_col1, json_col2 = st.columns([2, 1])
+
+    with json_col1:
+        def build_json():
+            # Prepare JSON data
+            json_export_data = {
+                'analysis_parameters': analysis_results.get('parameters', {}),
+                'analysis_algorithm': analysis_results.get('algorithm', 'Unknown'),
+                'export_timestamp': export_manager.timestamp
+            }
+            
+            if has_itemsets:
+                itemsets_json = analysis_results['frequent_itemsets'].copy()
+                itemsets_json['itemsets'] = [list(x) for x in itemsets_json['itemsets'].to_numpy()]
+                json_export_data['frequent_itemsets'] = itemsets_json.to_dict(orient='records')
+            
+            if has_rules:
+                rules_json = analysis_results['rules'].copy()
+                rules_json['antecedents'] = [list(x) for x in rules_json['antecedents'].to_numpy()]
+                rules_json['consequents'] = [list(x) for x in rules_json['consequents'].to_numpy()]
+                json_export_data['association_rules'] = rules_json[['antecedents', 'consequents', 'support', 'confidence', 'lift']].to_dict(orient='records')
+            
+            return export_manager.create_json_export(json_export_data)
     
-    if 'frequent_itemsets' in analysis_results and not analysis_results['frequent_itemsets'].empty:
-        itemsets_json = analysis_results['frequent_itemsets'].copy()
-        itemsets_json['itemsets'] = itemsets_json['itemsets'].apply(lambda x: list(x))
-        json_export_data['frequent_itemsets'] = itemsets_json.to_dict(orient='records')
+        json_data, json_filename = session_export(export_key, "json_complete", build_json)
+        file_size = export_manager.get_file_size_mb(json_data)
     
-    if 'rules' in analysis_results and not analysis_results['rules'].empty:
-        rules_json = analysis_results['rules'].copy()
-        rules_json['antecedents'] = rules_json['antecedents'].apply(lambda x: list(x))
-        rules_json['consequents'] = rules_json['consequents'].apply(lambda x: list(x))
-        json_export_data['association_rules'] = rules_json[['antecedents', 'consequents', 'support', 'confidence', 'lift']].to_dict(orient='records')
-    
-    json_data, json_filename = export_manager.create_json_export(json_export_data)
-    file_size = export_manager.get_file_size_mb(json_data)
-    
-    export_manager.create_download_button(
-        json_data,
-        json_filename,
-        f"🔗 Download JSON Data ({file_size:.2f} MB)",
-        "application/json",
-        "Download analysis results in machine-readable JSON format",
-        key="json_complete"
-    )
-
-with json_col2:
-    st.markdown("""
-    **JSON Format Benefits:**
-    - 🤖 Machine readable
-    - 🔄 API compatible
-    - 📊 Easy to parse
-    - 🌐 Web friendly
-    - 📱 Mobile compatible
-    """)
+        export_manager.create_download_button(
+            json_data,
+            json_filename,
+            f"🔗 Download JSON Data ({file_size:.2f} MB)",
+            "application/json",
+            "Download analysis results in machine-readable JSON format",
+            key="json_complete"
+        )
 
-st.markdown("---")
+    with json_col2:
+        st.markdown("""
+        **JSON Format Benefits:**
+        - 🤖 Machine readable
+        - 🔄 API compatible
+        - 📊 Easy to parse
+        - 🌐 Web friendly
+        - 📱 Mobile compatible
+        """)
+
+    st.markdown("---")
+
+    # PDF Report
+    st.markdown("#### 📄 PDF Report")
+    pdf_col1, pdf_col2 = st.columns([2, 1])
+
+    with pdf_col1:
+        pdf_data = processed_export(export_key, "pdf_report", lambda: export_manager.create_pdf_report(
+            analysis_results, processed_data
+        )[0])
+        pdf_filename = export_manager.filename("report", "pdf")
+        file_size = export_manager.get_file_size_mb(pdf_data)
+    
+        export_manager.create_download_button(
+            pdf_data,
+            pdf_filename,
+            f"📄 Download Executive Report ({file_size:.2f} MB)",
+            "application/pdf",
+            "Download a comprehensive PDF report with executive summary",
+            key="pdf_report"
+        )
 
-# PDF Report
-st.markdown("#### 📄 PDF Report")
-pdf_col1, pdf_col2 = st.columns([2, 1])
+    with pdf_col2:
+        st.markdown("""
+        **Report Contents:**
+        - 📋 Executive Summary
+        - 📊 Dataset Overview
+        - 🎯 Key Findings
+        - 📈 Top Rules Analysis
+        - 💡 Recommendations
+        """)
 
-with pdf_col1:
-    pdf_data, pdf_filename = export_manager.create_pdf_report(analysis_results, processed_data)
-    file_size = export_manager.get_file_size_mb(pdf_data)
-    
-    export_manager.create_download_button(
-        pdf_data,
-        pdf_filename,
-        f"📄 Download Executive Report ({file_size:.2f} MB)",
-        "application/pdf",
-        "Download a comprehensive PDF report with executive summary",
-        key="pdf_report"
-    )
-
-with pdf_col2:
-    st.markdown("""
-    **Report Contents:**
-    - 📋 Executive Summary
-    - 📊 Dataset Overview
-    - 🎯 Key Findings
-    - 📈 Top Rules Analysis
-    - 💡 Recommendations
-    """)
+    st.markdown('</div>', unsafe_allow_html=True)
 
-st.markdown('</div>', unsafe_allow_html=True)
+    # Complete Package Download
+    st.markdown('<div class="card-container-enhanced">', unsafe_allow_html=True)
+    st.markdown("### 📦 Complete Analysis Package")
 
-# Complete Package Download
-st.markdown('<div class="card-container-enhanced">', unsafe_allow_html=True)
-st.markdown("### 📦 Complete Analysis Package")
+    st.markdown("""
+    <div class="success-box-enhanced">
+        <strong>🎯 Recommended Download</strong><br>
+        Get everything in one convenient package! This ZIP file contains all export formats, 
+        organized in folders with detailed documentation.
+    </div>
+    """, unsafe_allow_html=True)
 
-st.markdown("""
-<div class="success-box-enhanced">
-    <strong>🎯 Recommended Download</strong><br>
-    Get everything in one convenient package! This ZIP file contains all export formats, 
-    organized in folders with detailed documentation.
-</div>
-""", unsafe_allow_html=True)
+    # The ZIP repeats every export above, so it is only built on request and kept
+    # in session state until the analysis results change
+    file_size_cache = st.session_state.setdefault('file_size_cache', {})
+    zip_export = st.session_state.get('zip_export')
+    if zip_export is not None and zip_export[0] != export_key:
+        zip_export = None
 
-# Create comprehensive ZIP
-zip_data, zip_filename = export_manager.create_comprehensive_zip(analysis_results, processed_data)
-file_size = export_manager.get_file_size_mb(zip_data)
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        if zip_export is None:
+            package_frames = [analysis_results.get('frequent_itemsets'), analysis_results.get('rules'), processed_data.get('clean_df')]
+            estimated_size = sum(export_manager.estimate_csv_size_mb(df) for df in package_frames if df is not None)
+        
+            if st.button(
+                f"📦 Prepare Complete Package (~{estimated_size:.2f} MB estimated)",
+                help="Build the ZIP package with CSV, Excel, JSON, PDF report, and documentation",
+                key="prepare_package",
+                use_container_width=True
+            ):
+                with st.spinner("Building complete package..."):
+                    zip_data, zip_filename = export_manager.create_comprehensive_zip(analysis_results, processed_data)
+                st.session_state.zip_export = (export_key, zip_data, zip_filename)
+                file_size_cache['complete_package'] = export_manager.get_file_size_mb(zip_data)
+                st.rerun(scope="fragment")
+        else:
+            _, zip_data, zip_filename = zip_export
+            export_manager.create_download_button(
+                zip_data,
+                zip_filename,
+                f"📦 Download Complete Package ({file_size_cache['complete_package']:.2f} MB)",
+                "application/zip",
+                "Download everything: CSV, Excel, JSON, PDF report, and documentation",
+                key="complete_package"
+            )
+
+    # Package contents
+    st.markdown("#### 📋 Package Contents")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        **📁 CSV Folder:**
+        - frequent_itemsets.csv
+        - association_rules.csv
+        - processed_data.csv
+        """)
 
-col1, col2, col3 = st.columns([1, 1, 1])
-with col2:
-    export_manager.create_download_button(
-        zip_data,
-        zip_filename,
-        f"📦 Download Complete Package ({file_size:.2f} MB)",
-        "application/zip",
-        "Download everything: CSV, Excel, JSON, PDF report, and documentation",
-        key="complete_package"
-    )
-
-# Package contents
-st.markdown("#### 📋 Package Contents")
-col1, col2, col3 = st.columns(3)
+    with col2:
+        st.markdown("""
+        **📁 Excel Folder:**
+        - Multi-sheet workbook
+        - All data organized
+        - Ready for analysis
+        """)
 
-with col1:
-    st.markdown("""
-    **📁 CSV Folder:**
-    - frequent_itemsets.csv
-    - association_rules.csv
-    - processed_data.csv
-    """)
+    with col3:
+        st.markdown("""
+        **📁 Reports Folder:**
+        - Executive PDF report
+        - JSON data export  
+        - README documentation
+        """)
 
-with col2:
-    st.markdown("""
-    **📁 Excel Folder:**
-    - Multi-sheet workbook
-    - All data organized
-    - Ready for analysis
-    """)
+    st.markdown('</div>', unsafe_allow_html=True)
 
-with col3:
-    st.markdown("""
-    **📁 Reports Folder:**
-    - Executive PDF report
-    - JSON data export  
-    - README documentation
-    """)
 
-st.markdown('</div>', unsafe_allow_html=True)
+downloads_section(analysis_results, processed_data)
 
 # Export statistics
 st.markdown('<div class="card-container-enhanced">', unsafe_allow_html=True)
@@ -363,11 +428,10 @@ with col2:
     """, unsafe_allow_html=True)
 
 with col3:
-    transactions_count = len(processed_data.get('transactions', []))
     st.markdown(f"""
     <div class="metric-card-enhanced">
         <div class="metric-icon">🛒</div>
-        <div class="metric-value">{transactions_count:,}</div>
+        <div class="metric-value">{n_transactions:,}</div>
         <div class="metric-label">Total Transactions</div>
     </div>
     """, unsafe_allow_html=True)
@@ -426,10 +490,10 @@ with col2:
 
 with col3:
     if st.button("🔄 New Analysis", type="primary", use_container_width=True):
-        # Reset session state for new analysis
-        for key in list(st.session_state.keys()):
-            if key not in ['export_ready']:  # Keep some states
-                del st.session_state[key]
+        # Reset session state for new analysis, keeping some states
+        keep = {k: st.session_state[k] for k in ('export_ready',) if k in st.session_state}
+        st.session_state.clear()
+        st.session_state.update(keep)
         st.switch_page("pages/1_📁_Data_Upload.py")
 
 # Update session state
@@ -448,7 +512,7 @@ st.sidebar.success("""
 - 📦 Complete ZIP Package
 
 **Total Size:** ~{:.2f} MB
-""".format(file_size if 'file_size' in locals() else 0))
+""".format(st.session_state.get('file_size_cache', {}).get('complete_package', 0)))
 
 st.sidebar.markdown("### 🎯 Quick Actions")
 if st.sidebar.button("📧 Email Support", help="Get help with downloads"):
@@ -2,12 +2,20 @@ import pandas as pd
 
 class DataProcessor:
     def __init__(self, file_path):
-        self.data = pd.read_csv(file_path)
+        # Parsing is deferred until the data is first requested
+        self._file_path = file_path
+        self._data = None
+
+    @property
+    def data(self):
+        return self.get_data()
 
     def get_data(self):
-        return self.data
+        if self._data is None:
+            self._data = pd.read_csv(self._file_path, engine='pyarrow', dtype_backend='pyarrow')
+        return self._data
 
     def clean_data(self):
         # Example: drop NaN rows
-        self.data.dropna(inplace=True)
-        return self.data
+        self._data = self.get_data().dropna()
+        return self._data
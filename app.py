@@ -1,8 +1,6 @@
 import streamlit as st
 import pandas as pd
 from utils.styles import load_custom_css
-from utils.data_processor import DataProcessor
-from utils.export_manager import ExportManager
 
 # Page config
 st.set_page_config(
@@ -221,8 +219,7 @@ with col3:
 st.sidebar.markdown("### 🎛️ Quick Controls")
 
 if st.sidebar.button("🔄 Reset Analysis", help="Clear all data and start fresh"):
-    for key in st.session_state.keys():
-        del st.session_state[key]
+    st.session_state.clear()
     initialize_session_state()
     st.rerun()
 
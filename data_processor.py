@@ -1,106 +1,124 @@
 import pandas as pd
 import numpy as np
-from mlxtend.preprocessing import TransactionEncoder
+from scipy.sparse import csr_matrix
 import streamlit as st
 import re
 from datetime import datetime
 
+# Arrow-backed strings run .str operations in vectorized kernels and store
+# repeated values compactly; plain Python strings are the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = pc = None
+    STRING_DTYPE = str
+
 class DataProcessor:
     """
     Comprehensive data processing utility for Market Basket Analysis
     Handles data cleaning, transformation, and preparation for analysis
     """
     
+    # Column-name keywords used to suggest a mapping for each analysis field
+    COLUMN_KEYWORDS = {
+        'transaction_id': ['transaction', 'order', 'invoice', 'receipt', 'bill', 'ticket', 'txn'],
+        'product_item': ['product', 'item', 'goods', 'article', 'sku', 'material', 'description', 'name', 'title'],
+        'customer_id': ['customer', 'client', 'user', 'buyer', 'member', 'cust'],
+        'date': ['date', 'time', 'timestamp', 'created', 'purchased', 'ordered'],
+        'price_sales': ['price', 'cost', 'amount', 'sales', 'revenue', 'value', 'total'],
+        'quantity': ['quantity', 'qty', 'count', 'number', 'units'],
+        'category': ['category', 'type', 'class', 'group', 'department', 'section']
+    }
+    
+    # One compiled alternation per field, so each column name is scanned once per field
+    _COLUMN_PATTERNS = {
+        category: re.compile('|'.join(map(re.escape, keywords)))
+        for category, keywords in COLUMN_KEYWORDS.items()
+    }
+    
+    # Text cleaning patterns, compiled once for all calls
+    _RE_SPECIAL = re.compile(r'[^\w\s-]')
+    _RE_WS = re.compile(r'\s+')
+    
+    # The same patterns for Arrow's RE2 engine, whose \w and \s only cover ASCII
+    _ARROW_SPECIAL = r'[^\p{L}\p{N}_\s\p{Z}-]'
+    _ARROW_WS = r'[\s\p{Z}]+'
+    
     def __init__(self):
         self.original_data = None
         self.processed_data = None
         self.column_mapping = {}
         self.preprocessing_steps = []
         self.transactions = None
-        self.basket_encoded = None
         
     def detect_column_types(self, df):
         """Intelligently detect column types based on content and names"""
-        potential_mappings = {
-            'transaction_id': [],
-            'product_item': [],
-            'customer_id': [],
-            'date': [],
-            'price_sales': [],
-            'quantity': [],
-            'category': []
-        }
+        potential_mappings = {category: [] for category in self.COLUMN_KEYWORDS}
         
         for col in df.columns:
             col_lower = col.lower().strip()
+            is_numeric = pd.api.types.is_numeric_dtype(df[col])
             
-            # Transaction ID detection patterns
-            if any(keyword in col_lower for keyword in [
-                'transaction', 'order', 'invoice', 'receipt', 'bill', 'ticket', 'txn'
-            ]):
-                potential_mappings['transaction_id'].append(col)
-            
-            # Product/Item detection patterns
-            if any(keyword in col_lower for keyword in [
-                'product', 'item', 'goods', 'article', 'sku', 'material', 
-                'description', 'name', 'title'
-            ]):
-                potential_mappings['product_item'].append(col)
-            
-            # Customer ID detection patterns
-            if any(keyword in col_lower for keyword in [
-                'customer', 'client', 'user', 'buyer', 'member', 'cust'
-            ]):
-                potential_mappings['customer_id'].append(col)
+            for category, pattern in self._COLUMN_PATTERNS.items():
+                if not pattern.search(col_lower):
+                    continue
+                
+                # Price and quantity columns must hold numbers; quantity names must not mention price
+                if category == 'price_sales' and not is_numeric:
+                    continue
+                if category == 'quantity' and ('price' in col_lower or not is_numeric):
+                    continue
+                
+                potential_mappings[category].append(col)
             
-            # Date detection patterns
-            if any(keyword in col_lower for keyword in [
-                'date', 'time', 'timestamp', 'created', 'purchased', 'ordered'
-            ]):
-                potential_mappings['date'].append(col)
-            elif df[col].dtype == 'datetime64[ns]':
+            # Date columns are also recognised by dtype
+            if df[col].dtype == 'datetime64[ns]' and col not in potential_mappings['date']:
                 potential_mappings['date'].append(col)
-            
-            # Price/Sales detection patterns
-            if any(keyword in col_lower for keyword in [
-                'price', 'cost', 'amount', 'sales', 'revenue', 'value', 'total'
-            ]):
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    potential_mappings['price_sales'].append(col)
-            
-            # Quantity detection patterns
-            if any(keyword in col_lower for keyword in [
-                'quantity', 'qty', 'count', 'number', 'units'
-            ]) and 'price' not in col_lower:
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    potential_mappings['quantity'].append(col)
-            
-            # Category detection patterns
-            if any(keyword in col_lower for keyword in [
-                'category', 'type', 'class', 'group', 'department', 'section'
-            ]):
-                potential_mappings['category'].append(col)
         
         return potential_mappings
     
     def clean_text_data(self, series):
         """Clean and standardize text data"""
-        # Convert to string and strip whitespace
-        cleaned = series.astype(str).str.strip()
+        # Names repeat across rows, so clean each distinct value once and map the
+        # results back; missing values get code -1 and stay missing
+        codes, uniques = pd.factorize(series)
         
-        # Remove special characters except spaces and hyphens
-        cleaned = cleaned.str.replace(r'[^\w\s-]', '', regex=True)
+        if pc is not None and isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == 'pyarrow':
+            # factorize returns the uniques as an Index; its .array is the ArrowStringArray
+            cleaned = self._clean_arrow_text(uniques.array)
+        else:
+            cleaned = self._clean_python_text(uniques)
         
-        # Standardize case (title case)
-        cleaned = cleaned.str.title()
-        
-        # Remove extra whitespaces
-        cleaned = cleaned.str.replace(r'\s+', ' ', regex=True)
+        return pd.Series(
+            pd.api.extensions.take(cleaned, codes, allow_fill=True),
+            index=series.index, name=series.name
+        )
+    
+    def _clean_python_text(self, values):
+        """Clean an array of values with the compiled Python regexes"""
+        remove_special = self._RE_SPECIAL.sub
+        collapse_whitespace = self._RE_WS.sub
         
-        # Remove empty strings
-        cleaned = cleaned.replace('', np.nan)
+        # Single pass per value: remove special characters except spaces and hyphens,
+        # collapse whitespace, strip and title-case; empty strings become NaN
+        cleaned = [
+            collapse_whitespace(' ', remove_special('', str(value))).strip().title() or np.nan
+            for value in values
+        ]
+        return np.array(cleaned, dtype=object)
+    
+    def _clean_arrow_text(self, values):
+        """Clean an Arrow-backed string array end to end in Arrow compute kernels"""
+        values = values.__arrow_array__()
+        values = pc.replace_substring_regex(values, self._ARROW_SPECIAL, '')
+        values = pc.replace_substring_regex(values, self._ARROW_WS, ' ')
+        values = pc.utf8_title(pc.utf8_trim_whitespace(values))
         
-        return cleaned
+        # Empty strings become missing, as in the Python path
+        values = pc.if_else(pc.equal(values, ''), pa.scalar(None, values.type), values)
+        return pd.arrays.ArrowStringArray(values)
     
     def validate_data_quality(self, df, transaction_col, product_col):
         """Validate data quality and return quality metrics"""
@@ -128,17 +146,61 @@ class DataProcessor:
         
         return quality_report
     
+    def build_transactions(self, clean_df):
+        """Group products into one list per transaction, ordered by TransactionID"""
+        # One stable sort by transaction code keeps each basket's original row order
+        tx_codes, _ = pd.factorize(clean_df['TransactionID'], sort=True)
+        order = np.argsort(tx_codes, kind='stable')
+        products = clean_df['Product'].to_numpy()[order]
+        
+        sizes = np.bincount(tx_codes)
+        ends = np.cumsum(sizes)
+        starts = ends - sizes
+        return [products[start:end].tolist() for start, end in zip(starts, ends)]
+    
+    def encode_basket(self, clean_df):
+        """One-hot encode transactions as a sparse boolean DataFrame (transactions x products)"""
+        # Rows follow the sorted TransactionID order of groupby; columns are sorted product names
+        product_codes, products = pd.factorize(clean_df['Product'], sort=True)
+        grouped = clean_df.groupby('TransactionID', observed=True)
+        rows = grouped.ngroup().to_numpy()
+        
+        matrix = csr_matrix(
+            (np.ones(len(product_codes), dtype=np.uint8), (rows, product_codes)),
+            shape=(grouped.ngroups, len(products))
+        )
+        # from_spmatrix fills with 0, which a bool SparseDtype rejects with a FutureWarning,
+        # so build on uint8 and cast the stored values to bool without densifying
+        basket = pd.DataFrame.sparse.from_spmatrix(matrix, columns=products)
+        return basket.astype(pd.SparseDtype(bool, False))
+    
+    def _coerce_numeric(self, series):
+        """Convert to numbers, skipping the pass when read_csv already parsed them"""
+        if pd.api.types.is_numeric_dtype(series):
+            return series
+        return pd.to_numeric(series, errors='coerce')
+    
+    def _coerce_datetime(self, series):
+        """Convert to datetimes, skipping the pass when the column already holds them"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        return pd.to_datetime(series, errors='coerce')
+    
     def process_data(self, df, column_mapping):
         """
         Main data processing pipeline
+        
+        The input frame is kept by reference as original_data and is never modified.
         """
         try:
-            self.original_data = df.copy()
+            self.original_data = df
             self.column_mapping = column_mapping
             self.preprocessing_steps = []
+            self.processed_data = None
             
             # Step 1: Extract required columns
-            working_df = df[[column_mapping['transaction_id'], column_mapping['product_item']]].copy()
+            # .loc builds a new frame that is not flagged as a copy, so no extra .copy() is needed
+            working_df = df.loc[:, [column_mapping['transaction_id'], column_mapping['product_item']]]
             working_df.columns = ['TransactionID', 'Product']
             
             # Add optional columns if available
@@ -146,13 +208,13 @@ class DataProcessor:
                 working_df['Customer'] = df[column_mapping['customer_id']]
             
             if column_mapping.get('price_sales'):
-                working_df['Price'] = pd.to_numeric(df[column_mapping['price_sales']], errors='coerce')
+                working_df['Price'] = self._coerce_numeric(df[column_mapping['price_sales']])
             
             if column_mapping.get('quantity'):
-                working_df['Quantity'] = pd.to_numeric(df[column_mapping['quantity']], errors='coerce')
+                working_df['Quantity'] = self._coerce_numeric(df[column_mapping['quantity']])
             
             if column_mapping.get('date'):
-                working_df['Date'] = pd.to_datetime(df[column_mapping['date']], errors='coerce')
+                working_df['Date'] = self._coerce_datetime(df[column_mapping['date']])
             
             self.preprocessing_steps.append(f"✅ Extracted {len(working_df.columns)} columns")
             
@@ -170,63 +232,58 @@ class DataProcessor:
             self.preprocessing_steps.append(f"⚠️ Removed {initial_rows - rows_after_cleaning} rows with missing data")
             
             # Step 4: Clean and standardize data
-            working_df['TransactionID'] = working_df['TransactionID'].astype(str).str.strip()
-            working_df['Product'] = self.clean_text_data(working_df['Product'])
+            working_df['TransactionID'] = working_df['TransactionID'].astype(STRING_DTYPE).str.strip()
+            working_df['Product'] = self.clean_text_data(working_df['Product'].astype(STRING_DTYPE))
             
             # Remove rows with empty products after cleaning
             working_df = working_df.dropna(subset=['Product'])
             
+            # Categorical codes let the later dedup, grouping and encoding steps
+            # work on integers instead of hashing strings, and repeat cheaply
+            working_df['TransactionID'] = working_df['TransactionID'].astype('category')
+            working_df['Product'] = working_df['Product'].astype('category')
+            
             self.preprocessing_steps.append("✅ Cleaned and standardized text data")
             
             # Step 5: Handle quantities (expand rows if needed)
             if 'Quantity' in working_df.columns:
-                expanded_rows = []
-                for _, row in working_df.iterrows():
-                    qty = max(1, int(row['Quantity'])) if not pd.isna(row['Quantity']) else 1
-                    qty = min(qty, 10)  # Cap at 10 to prevent explosion
-                    
-                    for _ in range(qty):
-                        new_row = row.copy()
-                        if 'Quantity' in new_row.index:
-                            new_row = new_row.drop('Quantity')
-                        expanded_rows.append(new_row)
+                # Missing quantities count as 1; cap at 10 to prevent explosion
+                qty = np.clip(working_df['Quantity'].fillna(1).to_numpy(), 1, 10).astype(np.int64)
                 
-                if len(expanded_rows) > len(working_df):
-                    working_df = pd.DataFrame(expanded_rows).reset_index(drop=True)
+                if qty.sum() > len(working_df):
+                    row_positions = np.repeat(np.arange(len(working_df)), qty)
+                    working_df = working_df.drop(columns=['Quantity']).iloc[row_positions].reset_index(drop=True)
                     self.preprocessing_steps.append("✅ Expanded rows based on quantities")
             
             # Step 6: Remove duplicates
-            initial_count = len(working_df)
-            working_df = working_df.drop_duplicates(subset=['TransactionID', 'Product'])
-            final_count = len(working_df)
+            # Every remaining transaction keeps at least one item, so no separate
+            # minimum-size filter is needed here (the page applies larger minimums)
+            duplicates = working_df.duplicated(['TransactionID', 'Product'])
+            duplicate_count = int(duplicates.sum())
             
-            if initial_count != final_count:
-                self.preprocessing_steps.append(f"⚠️ Removed {initial_count - final_count} duplicate entries")
+            if duplicate_count:
+                working_df = working_df[~duplicates]
+                self.preprocessing_steps.append(f"⚠️ Removed {duplicate_count} duplicate entries")
             
-            # Step 7: Filter transactions with minimum items
-            transaction_sizes = working_df.groupby('TransactionID').size()
-            valid_transactions = transaction_sizes[transaction_sizes >= 1].index
-            working_df = working_df[working_df['TransactionID'].isin(valid_transactions)]
-            
-            # Step 8: Create transactions for basket analysis
-            self.transactions = working_df.groupby('TransactionID')['Product'].apply(list).tolist()
+            # Step 7: Create transactions for basket analysis
+            self.transactions = self.build_transactions(working_df)
             
             if len(self.transactions) == 0:
                 raise ValueError("No transactions could be created")
             
-            # Step 9: One-hot encoding
-            te = TransactionEncoder()
-            te_array = te.fit(self.transactions).transform(self.transactions)
-            self.basket_encoded = pd.DataFrame(te_array, columns=te.columns_)
+            # One-hot encoding (encode_basket) is left to the caller, which applies
+            # its own filters to clean_df first and then encodes the final data once
+            n_products = working_df['Product'].nunique()
             
-            self.preprocessing_steps.append(f"✅ Created {len(self.transactions)} transactions with {len(te.columns_)} unique products")
-            self.preprocessing_steps.append("✅ Applied one-hot encoding for analysis")
+            self.preprocessing_steps.append(f"✅ Created {len(self.transactions)} transactions with {n_products} unique products")
             
             # Store processed data
             self.processed_data = {
                 'clean_df': working_df,
                 'transactions': self.transactions,
-                'basket_df': self.basket_encoded,
+                'n_transactions': len(self.transactions),
+                'n_products': n_products,
+                'total_items': len(working_df),
                 'quality_report': quality_report,
                 'preprocessing_steps': self.preprocessing_steps
             }
@@ -239,14 +296,21 @@ class DataProcessor:
     
     def get_processing_summary(self):
         """Get summary of processing steps and results"""
-        if not self.processed_data:
+        if not self.processed_data or not self.processed_data['n_transactions']:
             return None
         
+        # Read from processed_data so filters applied after processing are reflected
+        n_transactions = self.processed_data['n_transactions']
+        n_products = self.processed_data['n_products']
+        
+        # Baskets hold no duplicate products, so the item total also counts the matrix's filled cells
+        total_items = self.processed_data['total_items']
+        
         summary = {
-            'total_transactions': len(self.transactions),
-            'unique_products': len(self.basket_encoded.columns),
-            'avg_items_per_transaction': np.mean([len(t) for t in self.transactions]),
-            'sparsity': (self.basket_encoded.sum().sum() / (len(self.basket_encoded) * len(self.basket_encoded.columns))) * 100,
+            'total_transactions': n_transactions,
+            'unique_products': n_products,
+            'avg_items_per_transaction': total_items / n_transactions,
+            'sparsity': (total_items / (n_transactions * n_products)) * 100,
             'processing_steps': self.preprocessing_steps,
             'quality_report': self.processed_data.get('quality_report', {})
         }
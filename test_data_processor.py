@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+from data_processor import DataProcessor
+
+pytest.importorskip("pyarrow")
+
+
+def test_process_data_with_arrow_strings():
+    df = pd.DataFrame({
+        'OrderID': ['O1', 'O1', 'O2', 'O2', 'O3'],
+        'Product': ['whole  milk', 'Bread!', 'whole milk', '   ', 'bread'],
+    }).astype('string[pyarrow]')
+
+    processor = DataProcessor()
+    assert processor.process_data(df, {'transaction_id': 'OrderID', 'product_item': 'Product'}), processor.preprocessing_steps
+
+    processed = processor.processed_data
+    assert processed['transactions'] == [['Whole Milk', 'Bread'], ['Whole Milk'], ['Bread']]
+    assert processed['n_transactions'] == 3
+    assert processed['n_products'] == 2
+    assert processed['total_items'] == 4